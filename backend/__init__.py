@@ -0,0 +1 @@
+# Backend package for Movie Aggregator Service
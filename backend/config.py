@@ -1,39 +1,82 @@
 import os
+from dataclasses import dataclass
+from importlib.metadata import PackageNotFoundError, version
+from typing import Optional, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+def _package_version() -> str:
+    """Version of the installed package, falling back to the source tree's version"""
+    try:
+        return version("movie-aggregator-service")
+    except PackageNotFoundError:
+        return "1.0.0"
+
+def _env_list(name: str, default: str) -> Tuple[str, ...]:
+    """Comma-separated environment variable as a tuple of non-empty, stripped items"""
+    return tuple(item.strip() for item in os.getenv(name, default).split(",") if item.strip())
+
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Configuration settings for the Movie Aggregator Service"""
+    """
+    Configuration settings for the Movie Aggregator Service
+    
+    Environment variables are read and converted once at import time; the
+    instance is immutable afterwards.
+    """
     
     # Service settings
-    SERVICE_NAME = "Movie Aggregator Service"
-    SERVICE_VERSION = "1.0.0"
-    DEBUG = os.getenv("DEBUG", "False").lower() == "true"
+    SERVICE_NAME: str = "Movie Aggregator Service"
+    SERVICE_VERSION: str = _package_version()
+    DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "DEBUG" if DEBUG else "INFO").upper()  # Level for service logs
     
     # API settings
-    HOST = os.getenv("HOST", "0.0.0.0")
-    PORT = int(os.getenv("PORT", "8000"))
+    HOST: str = os.getenv("HOST", "0.0.0.0")
+    PORT: int = int(os.getenv("PORT", "8000"))
+    WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", "1"))  # Uvicorn worker processes
+    
+    # Security settings (comma-separated in the environment)
+    ALLOWED_HOSTS: Tuple[str, ...] = _env_list("ALLOWED_HOSTS", "localhost,127.0.0.1")
+    CORS_ORIGINS: Tuple[str, ...] = _env_list("CORS_ORIGINS", "http://localhost:3000,http://127.0.0.1:3000")
     
     # External API settings - Step 2: YouTube API Integration
-    YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
-    YOUTUBE_BASE_URL = "https://www.googleapis.com/youtube/v3"
+    YOUTUBE_API_KEY: Optional[str] = os.getenv("YOUTUBE_API_KEY")
+    YOUTUBE_BASE_URL: str = "https://www.googleapis.com/youtube/v3"
     
     # YouTube API optimization settings
-    YOUTUBE_REQUEST_TIMEOUT = float(os.getenv("YOUTUBE_REQUEST_TIMEOUT", "15.0"))
-    YOUTUBE_BATCH_SIZE = int(os.getenv("YOUTUBE_BATCH_SIZE", "50"))
-    YOUTUBE_MAX_RESULTS = int(os.getenv("YOUTUBE_MAX_RESULTS", "50"))
+    YOUTUBE_REQUEST_TIMEOUT: float = float(os.getenv("YOUTUBE_REQUEST_TIMEOUT", "15.0"))
+    YOUTUBE_BATCH_SIZE: int = int(os.getenv("YOUTUBE_BATCH_SIZE", "50"))
+    YOUTUBE_MAX_RESULTS: int = int(os.getenv("YOUTUBE_MAX_RESULTS", "50"))
+    YOUTUBE_MAX_CONCURRENCY: int = int(os.getenv("YOUTUBE_MAX_CONCURRENCY", "10"))  # In-flight API requests per worker
+    YOUTUBE_MAX_RETRIES: int = int(os.getenv("YOUTUBE_MAX_RETRIES", "3"))  # Retries on 429 / 5xx responses
+    # How long a response ETag is kept for If-None-Match revalidation (should exceed CACHE_TTL)
+    YOUTUBE_ETAG_TTL: int = int(os.getenv("YOUTUBE_ETAG_TTL", "86400"))  # 24 hours in seconds
+    
+    # TMDB API settings (services/tmdb_service.py)
+    TMDB_API_KEY: Optional[str] = os.getenv("TMDB_API_KEY")
+    TMDB_BASE_URL: str = "https://api.themoviedb.org/3"
+    TMDB_IMAGE_BASE_URL: str = "https://image.tmdb.org/t/p/w500"
     
     # Future API settings (will be used in Steps 3-4)
     # NEWS_API_KEY = os.getenv("NEWS_API_KEY")  # For additional interview data
     # SHOPIFY_API_KEY = os.getenv("SHOPIFY_API_KEY")  # For product data
     
-    # Rate limiting (will be implemented in future steps)
-    MAX_REQUESTS_PER_MINUTE = int(os.getenv("MAX_REQUESTS_PER_MINUTE", "100"))
+    # Rate limiting (per client IP)
+    MAX_REQUESTS_PER_MINUTE: int = int(os.getenv("MAX_REQUESTS_PER_MINUTE", "100"))
+    # e.g. redis://localhost:6379/0 to share the limit across workers (in-process if unset)
+    RATE_LIMIT_REDIS_URL: Optional[str] = os.getenv("RATE_LIMIT_REDIS_URL")
     
-    # Cache settings (will be implemented in future steps)
-    CACHE_TTL = int(os.getenv("CACHE_TTL", "3600"))  # 1 hour in seconds
+    # Cache settings for YouTube search results
+    CACHE_TTL: int = int(os.getenv("CACHE_TTL", "3600"))  # 1 hour in seconds
+    CACHE_MAX_SIZE: int = int(os.getenv("CACHE_MAX_SIZE", "1024"))  # Max cached searches
+    # Per-video details change slowly, so they're kept longer than search results
+    DETAILS_CACHE_TTL: int = int(os.getenv("DETAILS_CACHE_TTL", "86400"))  # 24 hours in seconds
+    DETAILS_CACHE_MAX_SIZE: int = int(os.getenv("DETAILS_CACHE_MAX_SIZE", "4096"))  # Max cached videos
+    # e.g. redis://localhost:6379/1 to share cached searches across workers and restarts
+    CACHE_REDIS_URL: Optional[str] = os.getenv("CACHE_REDIS_URL")
 
 # Global config instance
 config = Config()
@@ -0,0 +1,28 @@
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Union
+
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+def start_logging(level: Union[int, str] = logging.INFO) -> QueueListener:
+    """
+    Route service logs through a queue drained by a background thread
+
+    The "services" logger only enqueues records, so writing them to stderr
+    never blocks the event loop. Returns the started listener; stop() it on
+    shutdown to flush pending records.
+    """
+    log_queue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+
+    logger = logging.getLogger("services")
+    logger.handlers[:] = [QueueHandler(log_queue)]
+    logger.setLevel(level)
+    logger.propagate = False
+
+    listener.start()
+    return listener
@@ -1,78 +1,224 @@
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import Depends, FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from pydantic import BaseModel, validator
+from fastapi.responses import ORJSONResponse
+from contextlib import asynccontextmanager
+from pydantic import BaseModel, ConfigDict, validator
 from typing import List, Optional, Dict, Any
 import uvicorn
+import asyncio
+import math
 import sys
-import re
 import time
-from pathlib import Path
-from collections import defaultdict
-
-# Add the parent directory to the Python path to access services
-sys.path.append(str(Path(__file__).parent.parent))
-
-from services.youtube_service import youtube_service
+from collections import defaultdict, deque
+from functools import lru_cache
+
+from backend.config import config
+from backend.logging_config import start_logging
+from services.youtube_service import YouTubeService, get_youtube_service
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan: start logging and create the YouTube service on startup, release both on shutdown"""
+    log_listener = start_logging(config.LOG_LEVEL)
+    youtube_service = get_youtube_service()
+    yield
+    await youtube_service.aclose()
+    log_listener.stop()
+
+async def youtube_service_dependency() -> YouTubeService:
+    """
+    Endpoint dependency for the per-process YouTube service
+    
+    Async so FastAPI resolves it on the event loop rather than in the threadpool
+    """
+    return get_youtube_service()
 
 app = FastAPI(
-    title="Movie Aggregator Service",
+    title=config.SERVICE_NAME,
     description="Aggregates interviews with actors and brand-related products for movies",
-    version="1.0.0"
+    version=config.SERVICE_VERSION,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
-# Add security middleware
+class RateLimitASGIMiddleware:
+    """
+    Sliding-window rate limiting per client IP, implemented as pure ASGI middleware
+    
+    Runs for every HTTP request without creating a Request object or buffering
+    the response, and answers 429 directly when the client is over its limit.
+    
+    State lives in the worker process by default, so with several workers each
+    one enforces its own limit. Pass redis_url to share a fixed-window counter
+    per client across all workers instead.
+    """
+    
+    RATE_LIMIT_BODY = b'{"detail":"Rate limit exceeded. Please try again later."}'
+    
+    # Health checks and uptime probes often share an egress IP with user traffic,
+    # so they are never limited (a 429 there would look like an outage)
+    EXEMPT_PATHS = frozenset({"/", "/health"})
+    
+    def __init__(self, app, max_requests: int = 100, window: int = 60, redis_url: Optional[str] = None):
+        self.app = app
+        self.max_requests = max_requests
+        self.window = window
+        # Request timestamps (monotonic clock) per client IP, oldest first.
+        # A client never holds more than max_requests timestamps.
+        self.storage = defaultdict(lambda: deque(maxlen=max_requests))
+        self._next_sweep = time.monotonic() + window
+        
+        self.redis = None
+        if redis_url:
+            import redis.asyncio as redis  # Only needed for shared storage
+            self.redis = redis.from_url(redis_url)
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+        
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        
+        if self.redis is not None:
+            retry_after = await self._check_shared(client_ip)
+        else:
+            retry_after = self._check(client_ip)
+        
+        if retry_after:
+            await send({
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(self.RATE_LIMIT_BODY)).encode()),
+                    (b"retry-after", str(math.ceil(retry_after)).encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": self.RATE_LIMIT_BODY})
+            return
+        
+        await self.app(scope, receive, send)
+    
+    def _check(self, client_ip: str) -> float:
+        """
+        Record a request for client_ip if it is within the limit
+        
+        Returns 0 when the request is allowed, otherwise the number of seconds
+        until the oldest request leaves the window.
+        """
+        current_time = time.monotonic()
+        if current_time >= self._next_sweep:
+            self._sweep(current_time)
+        
+        timestamps = self.storage[client_ip]
+        
+        # Drop requests that fell out of the window
+        while timestamps and current_time - timestamps[0] >= self.window:
+            timestamps.popleft()
+        
+        if len(timestamps) >= self.max_requests:
+            return self.window - (current_time - timestamps[0])
+        
+        timestamps.append(current_time)
+        return 0.0
+    
+    def _sweep(self, current_time: float):
+        """Forget clients whose latest request is older than the window (at most once per window)"""
+        idle = [
+            client_ip for client_ip, timestamps in self.storage.items()
+            if not timestamps or current_time - timestamps[-1] >= self.window
+        ]
+        for client_ip in idle:
+            del self.storage[client_ip]
+        self._next_sweep = current_time + self.window
+    
+    async def _check_shared(self, client_ip: str) -> float:
+        """
+        Count a request for client_ip in Redis, shared by all workers
+        
+        Uses a fixed window aligned to wall-clock time (the monotonic clock
+        isn't comparable across processes). Returns 0 when the request is
+        allowed, otherwise the seconds left in the current window.
+        """
+        now = time.time()
+        key = f"ratelimit:{client_ip}:{int(now // self.window)}"
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                count, _ = await pipe.incr(key).expire(key, self.window).execute()
+        except Exception:
+            # Fail open: an unavailable Redis shouldn't take the API down
+            return 0.0
+        
+        if count > self.max_requests:
+            return self.window - (now % self.window)
+        return 0.0
+
+# Rate limiting is registered first so it sits inside the CORS middleware
+# and 429 responses still carry CORS headers
 app.add_middleware(
-    TrustedHostMiddleware, 
-    allowed_hosts=["localhost", "127.0.0.1", "*.yourdomain.com"]  # Add your production domain
+    RateLimitASGIMiddleware,
+    max_requests=config.MAX_REQUESTS_PER_MINUTE,
+    window=60,
+    redis_url=config.RATE_LIMIT_REDIS_URL
 )
 
+# Add security middleware. Host checking is only needed in production; skipping it
+# in debug mode keeps the middleware stack one layer shallower during development
+if not config.DEBUG:
+    app.add_middleware(
+        TrustedHostMiddleware, 
+        allowed_hosts=list(config.ALLOWED_HOSTS)
+    )
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:3000", "http://127.0.0.1:3000"],  # Add your production domain
+    allow_origins=list(config.CORS_ORIGINS),
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE"],
     allow_headers=["*"],
 )
 
-# Simple rate limiting storage
-rate_limit_storage = defaultdict(list)
-
-def rate_limit_check(client_ip: str, max_requests: int = 100, window: int = 60) -> bool:
-    """Simple rate limiting check"""
-    current_time = time.time()
-    # Clean old requests
-    rate_limit_storage[client_ip] = [
-        req_time for req_time in rate_limit_storage[client_ip] 
-        if current_time - req_time < window
-    ]
-    
-    # Check if limit exceeded
-    if len(rate_limit_storage[client_ip]) >= max_requests:
-        return False
-    
-    # Add current request
-    rate_limit_storage[client_ip].append(current_time)
-    return True
+# Upper bound for every endpoint's max_results, enforced by FastAPI before the handler runs
+MAX_RESULTS_LIMIT = 100
+
+# Deletion table for characters stripped from user input
+_SANITIZE_TABLE = str.maketrans('', '', '<>"\'')
+
+@lru_cache(maxsize=2048)
+def _sanitize(text: str) -> str:
+    """Strip whitespace and potentially dangerous characters (cached, popular titles repeat a lot)"""
+    return text.strip().translate(_SANITIZE_TABLE)
 
 def validate_input(text: str, max_length: int = 100) -> str:
-    """Validate and sanitize input"""
+    """Validate and sanitize input (the happy path never builds an exception)"""
     if not text or not isinstance(text, str):
-        raise HTTPException(status_code=400, detail="Invalid input")
-    
-    # Remove potentially dangerous characters
-    sanitized = re.sub(r'[<>"\']', '', text.strip())
+        reason = "Invalid input"
+    else:
+        # Remove potentially dangerous characters. Only short text goes through
+        # the cache, so oversized input that gets rejected can't fill it
+        if len(text) <= 2 * max_length:
+            sanitized = _sanitize(text)
+        else:
+            sanitized = _sanitize.__wrapped__(text)
+        
+        if len(sanitized) > max_length:
+            reason = f"Input too long. Max {max_length} characters."
+        elif len(sanitized) < 1:
+            reason = "Input cannot be empty"
+        else:
+            return sanitized
     
-    if len(sanitized) > max_length:
-        raise HTTPException(status_code=400, detail=f"Input too long. Max {max_length} characters.")
-    
-    if len(sanitized) < 1:
-        raise HTTPException(status_code=400, detail="Input cannot be empty")
-    
-    return sanitized
+    raise HTTPException(status_code=400, detail=reason)
 
 # Data models - Updated for Step 2: YouTube Integration
 class Video(BaseModel):
+    # Videos come from youtube_service and are validated once, by FastAPI's
+    # response_model check, so endpoints build them with model_construct
+    model_config = ConfigDict(extra='ignore', frozen=True)
+    
     id: str
     title: str
     description: Optional[str] = None
@@ -179,7 +325,7 @@ async def health_check():
     )
 
 @app.get("/movie/{movie_title}", response_model=MovieInfo)
-async def get_movie_info(movie_title: str, max_results: int = 50, request: Request = None):
+async def get_movie_info(movie_title: str, max_results: int = Query(default=50, ge=1, le=MAX_RESULTS_LIMIT), youtube_service: YouTubeService = Depends(youtube_service_dependency)):
     """
     Get movie information with YouTube content (Step 2 implementation)
     
@@ -194,16 +340,8 @@ async def get_movie_info(movie_title: str, max_results: int = 50, request: Reque
     - Brand/product aggregation (Step 4)
     """
     try:
-        # Rate limiting check
-        if request:
-            client_ip = request.client.host
-            if not rate_limit_check(client_ip):
-                raise HTTPException(status_code=429, detail="Rate limit exceeded. Please try again later.")
-        
         # Input validation
         movie_title = validate_input(movie_title, max_length=100)
-        if max_results > 100:
-            max_results = 100  # Cap at 100 to prevent abuse
         # Step 2: YouTube content search for movies (now optimized with batch fetching)
         videos = await youtube_service.search_movie_content(movie_title, max_results)
         
@@ -213,10 +351,10 @@ async def get_movie_info(movie_title: str, max_results: int = 50, request: Reque
                 detail=f"No content found for movie '{movie_title}'"
             )
         
-        # Format the data using our service (videos already have detailed info from batch fetch)
-        formatted_movie = youtube_service.format_movie_data(movie_title, videos)
-        
-        return MovieInfo(**formatted_movie)
+        # Format the data using our service (videos already have detailed info from batch fetch).
+        # The dict is returned as-is: FastAPI validates it against MovieInfo once, whereas
+        # building MovieInfo here would validate it, dump it and validate it again
+        return youtube_service.format_movie_data(movie_title, videos)
         
     except ValueError as e:
         # Configuration error (missing API key)
@@ -232,7 +370,7 @@ async def get_movie_info(movie_title: str, max_results: int = 50, request: Reque
         )
 
 @app.get("/search/{query}", response_model=List[Video])
-async def search_videos(query: str, max_results: int = 8):
+async def search_videos(query: str, max_results: int = Query(default=8, ge=1, le=MAX_RESULTS_LIMIT), youtube_service: YouTubeService = Depends(youtube_service_dependency)):
     """
     Search for videos (Step 2 enhancement)
     
@@ -246,7 +384,7 @@ async def search_videos(query: str, max_results: int = 8):
             return []
         
         # Videos already have detailed information from batch fetch
-        return [Video(**video) for video in videos]
+        return [Video.model_construct(**video) for video in videos]
         
     except Exception as e:
         raise HTTPException(
@@ -255,7 +393,7 @@ async def search_videos(query: str, max_results: int = 8):
         )
 
 @app.get("/interviews/{actor_name}", response_model=List[Video])
-async def get_actor_interviews(actor_name: str, movie_title: str = None, max_results: int = 8):
+async def get_actor_interviews(actor_name: str, movie_title: str = None, max_results: int = Query(default=8, ge=1, le=MAX_RESULTS_LIMIT), youtube_service: YouTubeService = Depends(youtube_service_dependency)):
     """
     Get actor interviews (Step 2 enhancement)
     
@@ -269,7 +407,7 @@ async def get_actor_interviews(actor_name: str, movie_title: str = None, max_res
             return []
         
         # Interviews already have detailed information from batch fetch
-        return [Video(**interview) for interview in interviews]
+        return [Video.model_construct(**interview) for interview in interviews]
         
     except Exception as e:
         raise HTTPException(
@@ -278,7 +416,7 @@ async def get_actor_interviews(actor_name: str, movie_title: str = None, max_res
         )
 
 @app.get("/actor/{actor_name}", response_model=ActorInfo)
-async def get_actor_info(actor_name: str, max_results: int = 15):
+async def get_actor_info(actor_name: str, max_results: int = Query(default=15, ge=1, le=MAX_RESULTS_LIMIT), youtube_service: YouTubeService = Depends(youtube_service_dependency)):
     """
     Get comprehensive actor information (Step 3: Actor Aggregation)
     
@@ -303,57 +441,68 @@ async def get_actor_info(actor_name: str, max_results: int = 15):
         # Interviews already have detailed information from batch fetch
         detailed_interviews = interviews
         
-        # Extract movie mentions from interview titles and descriptions
-        movies = youtube_service.extract_movies_from_content(detailed_interviews)
-        
-        # Get recent content (last 6 months)
-        recent_content = youtube_service.get_recent_content(detailed_interviews)
-        
-        # Get top interviews by view count
-        top_interviews = youtube_service.get_top_interviews(detailed_interviews)
-        
-        # Step 3: Enhanced actor analysis
-        interview_categories = youtube_service.categorize_interviews(detailed_interviews)
-        career_timeline = youtube_service.build_career_timeline(actor_name, movies, detailed_interviews)
-        collaboration_network = youtube_service.extract_collaborations(detailed_interviews, actor_name)
-        social_media_presence = youtube_service.extract_social_media_info(detailed_interviews, actor_name)
+        # The analysis helpers are CPU-bound, so run them in worker threads to keep the event loop free.
+        # Extract movie mentions first since the career timeline depends on them
+        movies = await asyncio.to_thread(youtube_service.extract_movies_from_content, detailed_interviews)
+        
+        # Recent content (last 6 months), top interviews by view count and Step 3 enhanced analysis
+        (
+            recent_content,
+            top_interviews,
+            interview_categories,
+            career_timeline,
+            collaboration_network,
+            social_media_presence,
+            genres
+        ) = await asyncio.gather(
+            asyncio.to_thread(youtube_service.get_recent_content, detailed_interviews),
+            asyncio.to_thread(youtube_service.get_top_interviews, detailed_interviews),
+            asyncio.to_thread(youtube_service.categorize_interviews, detailed_interviews),
+            asyncio.to_thread(youtube_service.build_career_timeline, actor_name, movies, detailed_interviews),
+            asyncio.to_thread(youtube_service.extract_collaborations, detailed_interviews, actor_name),
+            asyncio.to_thread(youtube_service.extract_social_media_info, detailed_interviews, actor_name),
+            # Extract genres from movie mentions
+            asyncio.to_thread(youtube_service.extract_genres_from_content, detailed_interviews)
+        )
         
         # Calculate enhanced statistics
         total_interviews = len(detailed_interviews)
-        total_views = sum(interview.get('view_count', 0) for interview in detailed_interviews)
         total_movies = len(movies)
         
-        # Calculate average rating from available data
-        ratings = [interview.get('rating', 0) for interview in detailed_interviews if interview.get('rating')]
-        average_rating = sum(ratings) / len(ratings) if ratings else None
-        
-        # Extract genres from movie mentions
-        genres = youtube_service.extract_genres_from_content(detailed_interviews)
-        
-        actor_info = {
-            'name': actor_name,
-            'movies': movies,
-            'total_interviews': total_interviews,
-            'total_views': total_views,
-            'interviews': detailed_interviews,
-            'recent_content': recent_content,
-            'top_interviews': top_interviews,
+        # Total views and average rating (from available data) in a single pass
+        total_views = 0
+        rating_sum = 0.0
+        rating_count = 0
+        for interview in detailed_interviews:
+            total_views += interview.get('view_count', 0) or 0
+            rating = interview.get('rating')
+            if rating:
+                rating_sum += rating
+                rating_count += 1
+        average_rating = rating_sum / rating_count if rating_count else None
+        
+        return ActorInfo(
+            name=actor_name,
+            movies=movies,
+            total_interviews=total_interviews,
+            total_views=total_views,
+            interviews=detailed_interviews,
+            recent_content=recent_content,
+            top_interviews=top_interviews,
             # Step 3: Enhanced information
-            'career_timeline': career_timeline,
-            'interview_categories': interview_categories,
-            'collaboration_network': collaboration_network,
-            'social_media_presence': social_media_presence,
-            'awards_and_nominations': [],  # Will be populated in future steps
-            'biography': None,  # Will be populated in future steps
-            'birth_date': None,  # Will be populated in future steps
-            'nationality': None,  # Will be populated in future steps
-            'total_movies': total_movies,
-            'average_rating': average_rating,
-            'genres': genres,
-            'years_active': None  # Will be populated in future steps
-        }
-        
-        return ActorInfo(**actor_info)
+            career_timeline=career_timeline,
+            interview_categories=interview_categories,
+            collaboration_network=collaboration_network,
+            social_media_presence=social_media_presence,
+            awards_and_nominations=[],  # Will be populated in future steps
+            biography=None,  # Will be populated in future steps
+            birth_date=None,  # Will be populated in future steps
+            nationality=None,  # Will be populated in future steps
+            total_movies=total_movies,
+            average_rating=average_rating,
+            genres=genres,
+            years_active=None  # Will be populated in future steps
+        )
         
     except ValueError as e:
         raise HTTPException(
@@ -367,7 +516,7 @@ async def get_actor_info(actor_name: str, max_results: int = 15):
         )
 
 @app.get("/discover/actors", response_model=List[ActorDiscoveryResult])
-async def discover_actors_from_movie(movie_title: str, max_results: int = 50):
+async def discover_actors_from_movie(movie_title: str, max_results: int = Query(default=50, ge=1, le=MAX_RESULTS_LIMIT), youtube_service: YouTubeService = Depends(youtube_service_dependency)):
     """
     Discover actors from a movie (Step 3: Actor Discovery)
     
@@ -387,11 +536,11 @@ async def discover_actors_from_movie(movie_title: str, max_results: int = 50):
                 detail=f"No content found for movie '{movie_title}'"
             )
         
-        # Extract actor names from video titles and descriptions with enhanced analysis
-        actors = youtube_service.extract_actors_from_movie_content_enhanced(movie_content, movie_title)
-        
-        # Limit results and return enhanced actor discovery data
-        return actors[:max_results]
+        # Extract the top actors from video titles and descriptions with enhanced analysis
+        # (CPU-bound regex work, so it runs in a thread instead of blocking the event loop)
+        return await asyncio.to_thread(
+            youtube_service.extract_actors_from_movie_content_enhanced, movie_content, movie_title, max_results
+        )
         
     except Exception as e:
         raise HTTPException(
@@ -400,7 +549,7 @@ async def discover_actors_from_movie(movie_title: str, max_results: int = 50):
         )
 
 @app.get("/actors/search", response_model=List[ActorDiscoveryResult])
-async def search_actors(query: str, max_results: int = 50):
+async def search_actors(query: str, max_results: int = Query(default=50, ge=1, le=MAX_RESULTS_LIMIT), youtube_service: YouTubeService = Depends(youtube_service_dependency)):
     """
     Search for actors by name or partial match (Step 3: Actor Search)
     
@@ -423,7 +572,7 @@ async def search_actors(query: str, max_results: int = 50):
         )
 
 @app.get("/actor/{actor_name}/interviews/analysis", response_model=Dict[str, Any])
-async def analyze_actor_interviews(actor_name: str, max_results: int = 20):
+async def analyze_actor_interviews(actor_name: str, max_results: int = Query(default=20, ge=1, le=MAX_RESULTS_LIMIT), youtube_service: YouTubeService = Depends(youtube_service_dependency)):
     """
     Analyze actor interviews for insights (Step 3: Interview Analysis)
     
@@ -455,7 +604,7 @@ async def analyze_actor_interviews(actor_name: str, max_results: int = 20):
         )
 
 @app.get("/actor/{actor_name}/career", response_model=List[ActorCareerEntry])
-async def get_actor_career(actor_name: str, max_results: int = 50):
+async def get_actor_career(actor_name: str, max_results: int = Query(default=50, ge=1, le=MAX_RESULTS_LIMIT), youtube_service: YouTubeService = Depends(youtube_service_dependency)):
     """
     Get actor career timeline and filmography (Step 3: Career Analysis)
     
@@ -484,7 +633,7 @@ async def get_actor_career(actor_name: str, max_results: int = 50):
         )
 
 @app.get("/actor/{actor_name}/collaborations", response_model=List[ActorCollaboration])
-async def get_actor_collaborations(actor_name: str, max_results: int = 20):
+async def get_actor_collaborations(actor_name: str, max_results: int = Query(default=20, ge=1, le=MAX_RESULTS_LIMIT), youtube_service: YouTubeService = Depends(youtube_service_dependency)):
     """
     Get actor's collaboration network (Step 3: Collaboration Analysis)
     
@@ -509,7 +658,7 @@ async def get_actor_collaborations(actor_name: str, max_results: int = 20):
         )
 
 @app.get("/actors/trending", response_model=List[ActorDiscoveryResult])
-async def get_trending_actors(period: str = "week", max_results: int = 50):
+async def get_trending_actors(period: str = "week", max_results: int = Query(default=50, ge=1, le=MAX_RESULTS_LIMIT), youtube_service: YouTubeService = Depends(youtube_service_dependency)):
     """
     Get trending actors based on recent interview activity (Step 3: Trending Analysis)
     
@@ -534,7 +683,7 @@ async def get_trending_actors(period: str = "week", max_results: int = 50):
         )
 
 @app.get("/actors/genre/{genre}", response_model=List[ActorDiscoveryResult])
-async def get_actors_by_genre(genre: str, max_results: int = 15):
+async def get_actors_by_genre(genre: str, max_results: int = Query(default=15, ge=1, le=MAX_RESULTS_LIMIT), youtube_service: YouTubeService = Depends(youtube_service_dependency)):
     """
     Get actors known for specific genres (Step 3: Genre Analysis)
     
@@ -559,7 +708,7 @@ async def get_actors_by_genre(genre: str, max_results: int = 15):
         )
 
 @app.get("/movie/{movie_title}/soundtrack", response_model=Dict[str, Any])
-async def get_movie_soundtrack(movie_title: str, max_results: int = 50):
+async def get_movie_soundtrack(movie_title: str, max_results: int = Query(default=50, ge=1, le=MAX_RESULTS_LIMIT), youtube_service: YouTubeService = Depends(youtube_service_dependency)):
     """
     Get soundtrack and music information for a movie or TV show
     
@@ -570,10 +719,17 @@ async def get_movie_soundtrack(movie_title: str, max_results: int = 50):
     - Music videos and performances
     """
     try:
-        # Search for music-related content
-        music_videos = await youtube_service.search_movie_content(f"{movie_title} soundtrack", max_results)
-        music_covers = await youtube_service.search_movie_content(f"{movie_title} music cover", max_results // 2)
-        music_analysis = await youtube_service.search_movie_content(f"{movie_title} music analysis", max_results // 2)
+        # Search for music-related content (the three searches are independent, so run them concurrently)
+        results = await asyncio.gather(
+            youtube_service.search_movie_content(f"{movie_title} soundtrack", max_results),
+            youtube_service.search_movie_content(f"{movie_title} music cover", max_results // 2),
+            youtube_service.search_movie_content(f"{movie_title} music analysis", max_results // 2),
+            return_exceptions=True
+        )
+        # A failed sub-search shouldn't fail the whole endpoint
+        music_videos, music_covers, music_analysis = [
+            [] if isinstance(result, BaseException) else result for result in results
+        ]
         
         # Combine and categorize music content
         soundtrack_info = {
@@ -604,5 +760,14 @@ async def get_movie_soundtrack(movie_title: str, max_results: int = 50):
         )
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop (libuv event loop) and httptools (C HTTP parser) cut per-request overhead;
+    # uvloop isn't available on Windows, where the default asyncio loop is used
+    uvicorn.run(
+        "backend.main:app",
+        host=config.HOST,
+        port=config.PORT,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=config.WEB_CONCURRENCY
+    )
 
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Test script for input sanitization
+Checks that the str.translate based _sanitize gives the same output as the
+regex it replaced
+"""
+
+import re
+
+from fastapi import HTTPException
+
+from backend.main import _SANITIZE_TABLE, _sanitize, validate_input
+
+SAMPLES = [
+    '<a href="x">it\'s</a>',
+    '  "\'<>\'"  ',
+    '',
+    '   ',
+    'Inception',
+    '  The Lord of the Rings: "The Two Towers"  ',
+    "Ocean's Eleven <script>alert('x')</script>",
+    '<<>>""\'\'',
+    'Amélie <3',
+    '\t"Dune"\n',
+]
+
+def _old_sanitize(text: str) -> str:
+    """The regex path _sanitize replaced"""
+    return re.sub(r'[<>"\']', '', text.strip())
+
+def test_sanitize_table_matches_regex():
+    """Translating with _SANITIZE_TABLE removes exactly what the regex removed"""
+    for text in SAMPLES:
+        assert text.strip().translate(_SANITIZE_TABLE) == _old_sanitize(text), repr(text)
+
+def test_sanitize_matches_regex():
+    """The cached _sanitize returns the same as the regex, including repeated calls"""
+    for text in SAMPLES * 2:
+        assert _sanitize(text) == _old_sanitize(text), repr(text)
+
+def test_rejected_long_input_is_not_cached():
+    """Oversized input is rejected without adding an entry to the _sanitize cache"""
+    before = _sanitize.cache_info().currsize
+    for i in range(50):
+        try:
+            validate_input(f"{i}" + "x" * 1_000_000)
+        except HTTPException as e:
+            assert e.status_code == 400
+        else:
+            raise AssertionError("1 MB input was accepted")
+    assert _sanitize.cache_info().currsize == before
+    # Long input that sanitizes down to a valid title is still accepted
+    assert validate_input(" " * 500 + "Dune" + " " * 500) == "Dune"
+
+if __name__ == "__main__":
+    test_sanitize_table_matches_regex()
+    test_sanitize_matches_regex()
+    test_rejected_long_input_is_not_cached()
+    print(f"✅ _sanitize matches the regex on {len(SAMPLES)} samples")
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test script for the YouTube search cache
+Runs the searches against an httpx.MockTransport, so no API key or network is needed
+"""
+
+import asyncio
+import os
+
+os.environ.setdefault("YOUTUBE_API_KEY", "test-key")
+
+import httpx
+
+from services.youtube_service import YouTubeService
+
+def _snippet(i: int) -> dict:
+    return {
+        'title': f'Dune trailer {i}',
+        'description': 'Official trailer',
+        'channelTitle': 'Warner Bros.',
+        'publishedAt': '2026-10-01T00:00:00Z',
+        'thumbnails': {'high': {'url': f'https://i.ytimg.com/vi/v{i}/hqdefault.jpg'}},
+    }
+
+def _make_service(calls: list, fail_first_details: bool = False) -> YouTubeService:
+    """A service whose client answers search and videos requests from fixed data"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        endpoint = request.url.path.rsplit('/', 1)[-1]
+        calls.append(endpoint)
+        if endpoint == 'search':
+            count = int(request.url.params['maxResults'])
+            items = [{'id': {'videoId': f'v{i}'}, 'snippet': _snippet(i)} for i in range(count)]
+            return httpx.Response(200, json={'items': items})
+        if fail_first_details and calls.count('videos') == 1:
+            return httpx.Response(400, json={'error': {'errors': [{'reason': 'badRequest'}]}})
+        items = [
+            {'id': video_id, 'snippet': _snippet(0), 'statistics': {'viewCount': '7'}, 'contentDetails': {'duration': 'PT2M'}}
+            for video_id in request.url.params['id'].split(',')
+        ]
+        return httpx.Response(200, json={'items': items})
+
+    service = YouTubeService()
+    # Keep the test in-process even when a Redis cache is configured
+    service._shared_cache = None
+    service._client = httpx.AsyncClient(base_url=service.base_url, transport=httpx.MockTransport(handler))
+    return service
+
+async def test_padded_results_are_not_cached():
+    """A search whose details call failed is fetched again instead of served from the cache"""
+    for method, args in (('search_movie_content', ('Dune', 5)), ('search_actor_interviews', ('Zendaya', None, 5))):
+        calls = []
+        async with _make_service(calls, fail_first_details=True) as service:
+            first = await getattr(service, method)(*args)
+            second = await getattr(service, method)(*args)
+            third = await getattr(service, method)(*args)
+        assert [video['view_count'] for video in first] == [0] * 5, method
+        assert [video['view_count'] for video in second] == [7] * 5, method
+        assert [video['view_count'] for video in third] == [7] * 5, method
+        assert calls == ['search', 'videos', 'search', 'videos'], (method, calls)
+
+async def test_callers_get_copies():
+    """Changing a returned video doesn't change what later calls return"""
+    calls = []
+    async with _make_service(calls) as service:
+        for method, args in (('search_movie_content', ('Dune', 3)), ('search_actor_interviews', ('Zendaya', None, 3))):
+            videos = await getattr(service, method)(*args)
+            videos[0]['title'] = 'changed'
+            videos[0]['view_count'] = -1
+            videos = await getattr(service, method)(*args)
+            assert videos[0]['title'] == 'Dune trailer 0', method
+            assert videos[0]['view_count'] == 7, method
+
+        details = await service.get_video_details('v0')
+        details['view_count'] = -1
+        assert (await service.get_video_details('v0'))['view_count'] == 7
+
+async def test_clamped_max_results_share_an_entry():
+    """Requests above the limit clamp to the same search and hit the same cache entry"""
+    calls = []
+    async with _make_service(calls) as service:
+        await service.search_movie_content('Dune', 500)
+        await service.search_movie_content('Dune', 1000)
+        await service.search_actor_interviews('Zendaya', None, 20)
+        await service.search_actor_interviews('Zendaya', None, 30)
+    assert calls.count('search') == 2, calls
+
+if __name__ == "__main__":
+    asyncio.run(test_padded_results_are_not_cached())
+    asyncio.run(test_callers_get_copies())
+    asyncio.run(test_clamped_max_results_share_an_entry())
+    print("✅ Search cache tests passed")
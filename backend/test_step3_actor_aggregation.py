@@ -6,12 +6,9 @@ Run this to verify all the new Step 3 features are working correctly
 
 import asyncio
 import sys
-from pathlib import Path
 
-# Add the parent directory to the Python path to access services
-sys.path.append(str(Path(__file__).parent.parent))
-
-from services.youtube_service import youtube_service
+from backend.config import config
+from services.youtube_service import YouTubeService
 
 async def test_step3_actor_aggregation():
     """Test all Step 3: Actor Interview Aggregation features"""
@@ -19,6 +16,8 @@ async def test_step3_actor_aggregation():
     print("🎭 Testing Step 3: Actor Interview Aggregation...")
     print("=" * 60)
     
+    youtube_service = YouTubeService()
+    
     try:
         # Test 1: Enhanced Actor Information
         print("\n1️⃣ Testing Enhanced Actor Information...")
@@ -113,10 +112,12 @@ async def test_step3_actor_aggregation():
         print(f"❌ Test failed with error: {str(e)}")
         import traceback
         traceback.print_exc()
+    finally:
+        await youtube_service.aclose()
 
 if __name__ == "__main__":
     # Check if API key is configured
-    if not youtube_service.api_key:
+    if not config.YOUTUBE_API_KEY:
         print("❌ YOUTUBE_API_KEY not configured!")
         print("Please set YOUTUBE_API_KEY in your .env file")
         sys.exit(1)
@@ -6,11 +6,6 @@ Run this to test if your YouTube API key is working
 
 import os
 import asyncio
-import sys
-from pathlib import Path
-
-# Add the parent directory to the Python path to access services
-sys.path.append(str(Path(__file__).parent.parent))
 
 from dotenv import load_dotenv
 from services.youtube_service import YouTubeService
@@ -85,7 +80,7 @@ async def main():
     
     if success:
         print("\n✅ Ready to run the main service!")
-        print("Run: uvicorn main:app --reload")
+        print("Run: uvicorn backend.main:app --reload")
     else:
         print("\n❌ Please fix the issues above before running the main service.")
 
@@ -6,12 +6,10 @@ Run this to verify the service is working correctly
 
 import asyncio
 import sys
-from pathlib import Path
+import time
 
-# Add the parent directory to the Python path to access services
-sys.path.append(str(Path(__file__).parent.parent))
-
-from services.youtube_service import youtube_service
+from backend.config import config
+from services.youtube_service import YouTubeService
 
 async def test_youtube_service():
     """Test the YouTube service functionality"""
@@ -19,6 +17,8 @@ async def test_youtube_service():
     print("🧪 Testing YouTube Service...")
     print("=" * 50)
     
+    youtube_service = YouTubeService()
+    
     try:
         # Test 1: Search for movie content
         print("\n1️⃣ Testing movie content search...")
@@ -48,16 +48,32 @@ async def test_youtube_service():
         else:
             print("❌ No interviews found")
         
+        # Test 3: Concurrent searches share the HTTP/2 connection and request semaphore
+        print("\n3️⃣ Testing concurrent movie searches...")
+        titles = ["Inception", "Interstellar", "Tenet", "Dunkirk", "Oppenheimer"]
+        start = time.perf_counter()
+        results = await asyncio.gather(*(youtube_service.search_movie_content(title, max_results=5) for title in titles))
+        elapsed = time.perf_counter() - start
+        
+        for title, title_videos in zip(titles, results):
+            print(f"   {title}: {len(title_videos)} videos")
+        if all(results):
+            print(f"✅ {len(titles)} searches completed concurrently in {elapsed:.2f}s")
+        else:
+            print(f"❌ Some searches returned no videos ({elapsed:.2f}s)")
+        
         print("\n✅ All tests completed successfully!")
         
     except Exception as e:
         print(f"❌ Test failed with error: {str(e)}")
         import traceback
         traceback.print_exc()
+    finally:
+        await youtube_service.aclose()
 
 if __name__ == "__main__":
     # Check if API key is configured
-    if not youtube_service.api_key:
+    if not config.YOUTUBE_API_KEY:
         print("❌ YOUTUBE_API_KEY not configured!")
         print("Please set YOUTUBE_API_KEY in your .env file")
         sys.exit(1)
@@ -0,0 +1,79 @@
+import time
+import orjson
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+class TTLCache:
+    """
+    Small in-process LRU cache whose entries expire after `ttl` seconds
+
+    Used to memoize YouTube API results so repeated queries skip the network.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired"""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        """Store value under key, evicting the least recently used entries if full"""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+class RedisCache:
+    """
+    JSON values in Redis that expire after `ttl` seconds
+    
+    Shared by all workers and kept across restarts, so it sits behind the
+    in-process TTLCache. Errors are treated as cache misses: an unavailable
+    Redis only costs the API call it would have saved.
+    """
+
+    def __init__(self, url: str, ttl: int, prefix: str = "cache"):
+        import redis.asyncio as redis  # Only needed when a shared cache is configured
+        self.redis = redis.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def _key(self, key: tuple) -> str:
+        return ":".join([self.prefix, *map(str, key)])
+
+    async def get(self, key: tuple) -> Optional[Any]:
+        """Return the cached value for key, or None if missing, expired or unreachable"""
+        try:
+            raw = await self.redis.get(self._key(key))
+        except Exception:
+            return None
+        return orjson.loads(raw) if raw is not None else None
+
+    async def set(self, key: tuple, value: Any):
+        """Store value under key for ttl seconds, ignoring Redis errors"""
+        try:
+            await self.redis.set(self._key(key), orjson.dumps(value), ex=self.ttl)
+        except Exception:
+            pass
+
+    async def aclose(self):
+        await self.redis.aclose()
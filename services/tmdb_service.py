@@ -1,7 +1,9 @@
-import aiohttp
+import heapq
+import httpx
+import orjson
 import asyncio
 from typing import Optional, List, Dict, Any
-from config import config
+from backend.config import config
 
 class TMDBService:
     """Service for interacting with The Movie Database (TMDB) API"""
@@ -13,65 +15,101 @@ class TMDBService:
         
         if not self.api_key:
             raise ValueError("TMDB_API_KEY is required. Please set it in your .env file.")
+        
+        # Shared HTTP/2 client, created on first use, so connections are reused between calls
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it if needed"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close the shared HTTP client (called on application shutdown)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     async def search_movie(self, query: str) -> Optional[Dict[str, Any]]:
         """Search for a movie by title"""
-        async with aiohttp.ClientSession() as session:
-            params = {
-                'api_key': self.api_key,
-                'query': query,
-                'language': 'en-US',
-                'page': 1,
-                'include_adult': False
-            }
-            
-            async with session.get(f"{self.base_url}/search/movie", params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    if data.get('results'):
-                        return data['results'][0]  # Return first result
-                return None
+        params = {
+            'api_key': self.api_key,
+            'query': query,
+            'language': 'en-US',
+            'page': 1,
+            'include_adult': False
+        }
+        
+        response = await self._get_client().get(f"{self.base_url}/search/movie", params=params)
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
+            if data.get('results'):
+                return data['results'][0]  # Return first result
+        return None
     
     async def get_movie_details(self, movie_id: int) -> Optional[Dict[str, Any]]:
         """Get detailed information about a specific movie"""
-        async with aiohttp.ClientSession() as session:
-            params = {
-                'api_key': self.api_key,
-                'language': 'en-US',
-                'append_to_response': 'credits,images'
-            }
-            
-            async with session.get(f"{self.base_url}/movie/{movie_id}", params=params) as response:
-                if response.status == 200:
-                    return await response.json()
-                return None
+        params = {
+            'api_key': self.api_key,
+            'language': 'en-US',
+            'append_to_response': 'credits,images'
+        }
+        
+        response = await self._get_client().get(f"{self.base_url}/movie/{movie_id}", params=params)
+        if response.status_code == 200:
+            return orjson.loads(response.content)
+        return None
     
     async def get_movie_credits(self, movie_id: int) -> Optional[Dict[str, Any]]:
         """Get cast and crew information for a movie"""
-        async with aiohttp.ClientSession() as session:
-            params = {
-                'api_key': self.api_key,
-                'language': 'en-US'
-            }
-            
-            async with session.get(f"{self.base_url}/movie/{movie_id}/credits", params=params) as response:
-                if response.status == 200:
-                    return await response.json()
-                return None
+        params = {
+            'api_key': self.api_key,
+            'language': 'en-US'
+        }
+        
+        response = await self._get_client().get(f"{self.base_url}/movie/{movie_id}/credits", params=params)
+        if response.status_code == 200:
+            return orjson.loads(response.content)
+        return None
+    
+    async def get_movie_full(self, movie_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get formatted movie details including the cast
+        
+        get_movie_details already appends credits to the response, so this needs
+        one round trip rather than separate details and credits calls
+        """
+        movie_data = await self.get_movie_details(movie_id)
+        if movie_data is None:
+            return None
+        return self.format_movie_data(movie_data)
     
     def format_movie_data(self, movie_data: Dict[str, Any], credits_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Format movie data into our standard structure"""
+        # Details fetched with append_to_response=credits already carry the cast
+        if credits_data is None:
+            credits_data = movie_data.get('credits')
+        
+        img = self.image_base_url
+        poster_path = movie_data.get('poster_path')
+        backdrop_path = movie_data.get('backdrop_path')
+        release_date = movie_data.get('release_date')
+        
         formatted = {
             'id': movie_data.get('id'),
             'title': movie_data.get('title'),
             'original_title': movie_data.get('original_title'),
             'overview': movie_data.get('overview'),
-            'release_date': movie_data.get('release_date'),
-            'year': movie_data.get('release_date', '')[:4] if movie_data.get('release_date') else None,
+            'release_date': release_date,
+            'year': release_date[:4] if release_date else None,
             'runtime': movie_data.get('runtime'),
             'genres': [genre['name'] for genre in movie_data.get('genres', [])],
-            'poster_path': f"{self.image_base_url}{movie_data.get('poster_path')}" if movie_data.get('poster_path') else None,
-            'backdrop_path': f"{self.image_base_url}{movie_data.get('backdrop_path')}" if movie_data.get('backdrop_path') else None,
+            'poster_path': f"{img}{poster_path}" if poster_path else None,
+            'backdrop_path': f"{img}{backdrop_path}" if backdrop_path else None,
             'vote_average': movie_data.get('vote_average'),
             'vote_count': movie_data.get('vote_count'),
             'actors': [],
@@ -81,14 +119,14 @@ class TMDBService:
         
         # Add actor information if credits data is available
         if credits_data and 'cast' in credits_data:
-            # Get top 10 actors by order
-            top_actors = sorted(credits_data['cast'], key=lambda x: x.get('order', 999))[:10]
+            # Get top 10 actors by order (partial selection, no full sort of the cast)
+            top_actors = heapq.nsmallest(10, credits_data['cast'], key=lambda x: x.get('order', 999))
             formatted['actors'] = [
                 {
                     'id': actor.get('id'),
                     'name': actor.get('name'),
                     'character': actor.get('character'),
-                    'profile_path': f"{self.image_base_url}{actor.get('profile_path')}" if actor.get('profile_path') else None,
+                    'profile_path': f"{img}{profile_path}" if (profile_path := actor.get('profile_path')) else None,
                     'order': actor.get('order')
                 }
                 for actor in top_actors
@@ -96,5 +134,3 @@ class TMDBService:
         
         return formatted
 
-# Global instance
-tmdb_service = TMDBService()
@@ -1,12 +1,132 @@
 import httpx
-import json
+import orjson
 import asyncio
-from typing import Optional, List, Dict, Any
-from config import config
+import heapq
+import logging
+import random
+import re
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from operator import itemgetter
+from typing import Optional, List, Dict, Any, Tuple
+from backend.config import config
+from services.cache import RedisCache, TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Stats used for videos whose details could not be fetched
+_DEFAULT_STATS = {'view_count': 0, 'like_count': 0, 'comment_count': 0, 'duration': ''}
+
+# Patterns used by the extract_* helpers, compiled once instead of on every video
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+_IN_TITLE_RE = re.compile(r'in\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)')
+# A person's name: one to four capitalized words. The bound keeps long runs of
+# capitalized words from being taken as a name and limits regex backtracking
+_NAME = r'[A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,3}'
+_ACTOR_INTERVIEW_RE = re.compile(rf'^({_NAME})\s+Interview')
+_INTERVIEW_WITH_RE = re.compile(rf'Interview\s+with\s+({_NAME})')
+# Actor-name title patterns as one alternation: a single search finds the leftmost
+# match, and the named group that matched (m.lastgroup) holds the name
+_ACTOR_NAME_RE = re.compile(
+    rf'^(?P<name_interview>{_NAME})\s+Interview'  # "Actor Name Interview"
+    rf'|Interview\s+with\s+(?P<interview_with>{_NAME})'  # "Interview with Actor Name"
+    rf'|(?P<on_show>{_NAME})\s+on\s+[A-Z]'  # "Actor Name on Show"
+    rf'|(?P<talks_about>{_NAME})\s+talks\s+about'  # "Actor Name talks about"
+)
+# Lowercase title keywords that raise actor confidence (interview verbs, professional sources)
+_INTERVIEW_VERB_RE = re.compile(r'talks about|discusses|reveals')
+_PROFESSIONAL_SOURCE_RE = re.compile(r'show|program|channel|network|tv')
+# Lowercase keywords that mark each genre in titles and descriptions
+_GENRE_KEYWORDS = {
+    'action': ('action', 'thriller', 'adventure', 'war', 'martial arts'),
+    'comedy': ('comedy', 'funny', 'humor', 'satire', 'rom-com'),
+    'drama': ('drama', 'emotional', 'serious', 'character study'),
+    'horror': ('horror', 'scary', 'frightening', 'supernatural'),
+    'sci_fi': ('science fiction', 'sci-fi', 'futuristic', 'space', 'alien'),
+    'romance': ('romance', 'love story', 'romantic', 'relationship'),
+    'fantasy': ('fantasy', 'magical', 'superhero', 'mythical'),
+    'documentary': ('documentary', 'biography', 'real story', 'true story'),
+    'animation': ('animation', 'animated', 'cartoon', 'pixar', 'disney'),
+}
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+_INSTAGRAM_PATTERNS = (
+    re.compile(r'@([a-zA-Z0-9._]+)'),  # @username
+    re.compile(r'instagram\.com/([a-zA-Z0-9._]+)'),  # instagram.com/username
+    re.compile(r'#([a-zA-Z0-9_]+)'),  # hashtags
+)
+
+@lru_cache(maxsize=4096)
+def _parse_published_at(published_at: str) -> Optional[datetime]:
+    """Parse an API timestamp (e.g. 2024-01-01T00:00:00Z) to a UTC-aware datetime, or None if malformed"""
+    try:
+        published = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return published if published.tzinfo else published.replace(tzinfo=timezone.utc)
+
+@lru_cache(maxsize=256)
+def _collaboration_patterns(actor_name: str) -> Tuple[re.Pattern, re.Pattern]:
+    """Compiled "Actor with/and Collaborator" and "Interview with Actor and Collaborator" patterns for an actor"""
+    actor = re.escape(actor_name)
+    return (
+        re.compile(rf'{actor}\s+(?:with|and)\s+({_NAME})'),
+        re.compile(rf'Interview\s+with\s+{actor}\s+and\s+({_NAME})'),
+    )
 
 class YouTubeService:
     """Service for interacting with YouTube Data API v3"""
     
+    # 403 error reasons that mean the API key is out of quota rather than forbidden
+    _QUOTA_ERROR_REASONS = frozenset({'quotaExceeded', 'dailyLimitExceeded', 'rateLimitExceeded', 'userRateLimitExceeded'})
+    
+    # Partial-response field masks: only the parts of each item we read are sent back
+    _THUMBNAIL_FIELDS = 'thumbnails(high/url,medium/url,default/url)'
+    _SEARCH_FIELDS = f'items(id/videoId,snippet(title,description,channelTitle,publishedAt,{_THUMBNAIL_FIELDS}))'
+    _VIDEO_FIELDS = (
+        f'items(id,snippet(title,description,channelTitle,publishedAt,{_THUMBNAIL_FIELDS}),'
+        'statistics(viewCount,likeCount,commentCount),contentDetails/duration)'
+    )
+    
+    # Upper bound on a single retry delay, whether from Retry-After or exponential backoff
+    _MAX_RETRY_DELAY = 30.0
+    
+    # Response field for each video category in format_movie_data
+    _CATEGORY_FIELDS = (
+        ('trailers', 'trailer'),
+        ('interviews', 'interview'),
+        ('behind_the_scenes', 'behind_the_scenes'),
+        ('reviews', 'review'),
+        ('clips', 'clip'),
+        ('music', 'music'),
+        ('other', 'other'),
+    )
+    
+    # One alternative per category, in priority order. Each is a lookahead from the
+    # start of the title, so the first category with any keyword wins (not the
+    # keyword that appears first), and its empty named group gives the category.
+    _CATEGORY_PATTERN = re.compile(
+        r'(?:(?=.*?(?:trailer|teaser))(?P<trailer>)'
+        r'|(?=.*?(?:interview|q&a|qa))(?P<interview>)'
+        r'|(?=.*?(?:behind the scenes|bts|making of))(?P<behind_the_scenes>)'
+        r'|(?=.*?(?:review|critic))(?P<review>)'
+        r'|(?=.*?(?:clip|scene|moment))(?P<clip>)'
+        r'|(?=.*?(?:music|song|soundtrack))(?P<music>))',
+        re.IGNORECASE | re.DOTALL
+    )
+    
+    # Interview types for categorize_interviews, matched the same way as _CATEGORY_PATTERN
+    _INTERVIEW_TYPE_PATTERN = re.compile(
+        r'(?:(?=.*?(?:junket|press|roundtable))(?P<press_junket>)'
+        r'|(?=.*?(?:talk show|late night|tonight show|ellen))(?P<talk_show>)'
+        r'|(?=.*?(?:podcast|episode))(?P<podcast>)'
+        r'|(?=.*?(?:red carpet|premiere|awards))(?P<red_carpet>)'
+        r'|(?=.*?(?:behind the scenes|bts|making of))(?P<behind_scenes>)'
+        r'|(?=.*?(?:q&a|qa|question))(?P<q_and_a>)'
+        r'|(?=.*?(?:documentary|biography))(?P<documentary>))',
+        re.IGNORECASE | re.DOTALL
+    )
+    
     def __init__(self):
         self.api_key = config.YOUTUBE_API_KEY
         self.base_url = config.YOUTUBE_BASE_URL
@@ -20,6 +140,77 @@ class YouTubeService:
             'Referer': 'http://localhost:8000/',
             'Accept': 'application/json'
         }
+        
+        # Search results are cached per query so repeated requests skip the API
+        self._search_cache = TTLCache(maxsize=config.CACHE_MAX_SIZE, ttl=config.CACHE_TTL)
+        # Optional second level in Redis, shared by all workers and kept across restarts
+        self._shared_cache = (
+            RedisCache(config.CACHE_REDIS_URL, ttl=config.CACHE_TTL, prefix='youtube')
+            if config.CACHE_REDIS_URL else None
+        )
+        
+        # Video details are cached per video id, so every lookup (including the detail step of
+        # a search) only fetches the ids not seen recently
+        self._details_cache = TTLCache(maxsize=config.DETAILS_CACHE_MAX_SIZE, ttl=config.DETAILS_CACHE_TTL)
+        
+        # Last (etag, data) per request, so expired results are revalidated with If-None-Match
+        # and a 304 reuses the decoded body instead of downloading and parsing it again
+        self._etag_store = TTLCache(maxsize=config.CACHE_MAX_SIZE, ttl=config.YOUTUBE_ETAG_TTL)
+        
+        # Shared HTTP/2 client, created on first use, so connections are reused between calls
+        self._client: Optional[httpx.AsyncClient] = None
+        
+        # Caps in-flight API requests so concurrent endpoints don't burst past YouTube's rate limits
+        self._request_semaphore = asyncio.Semaphore(config.YOUTUBE_MAX_CONCURRENCY)
+        
+        # Requests currently on the wire, so identical concurrent calls share one response
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it if needed"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                http2=True,
+                headers=self.headers,
+                timeout=config.YOUTUBE_REQUEST_TIMEOUT,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close the shared HTTP client and cache connection (called on application shutdown)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._shared_cache is not None:
+            await self._shared_cache.aclose()
+    
+    async def __aenter__(self) -> "YouTubeService":
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
+    async def _get_cached_search(self, cache_key: tuple) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up search results in the in-process cache, then in the shared cache if configured
+        
+        The returned list and its video dicts are the cached objects: copy them
+        before handing them to callers
+        """
+        cached = self._search_cache.get(cache_key)
+        if cached is None and self._shared_cache is not None:
+            cached = await self._shared_cache.get(cache_key)
+            if cached is not None:
+                self._search_cache.set(cache_key, cached)
+        return cached
+    
+    async def _set_cached_search(self, cache_key: tuple, results: List[Dict[str, Any]]):
+        """Store search results in the in-process cache and the shared cache if configured"""
+        self._search_cache.set(cache_key, results)
+        if self._shared_cache is not None:
+            await self._shared_cache.set(cache_key, results)
     
     async def _make_request(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -32,85 +223,151 @@ class YouTubeService:
         Returns:
             API response data or None if failed
         """
+        store_key = (endpoint, tuple(sorted((k, v) for k, v in params.items() if k != 'key')))
+        
+        # Join an identical request already in flight instead of sending another
+        task = self._inflight.get(store_key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(endpoint, params, store_key))
+            self._inflight[store_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(store_key, None))
+        
+        # Shielded so a cancelled caller doesn't cancel the request for the others
+        return await asyncio.shield(task)
+    
+    async def _fetch(self, endpoint: str, params: Dict[str, Any], store_key: tuple) -> Optional[Dict[str, Any]]:
+        """Send a request (revalidating with a stored ETag and retrying transient failures) and decode the response"""
+        stored = self._etag_store.get(store_key)
+        headers = {'If-None-Match': stored[0]} if stored else None
+        
         try:
-            print(f"Making YouTube API request to {endpoint} with params: {params}")
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/{endpoint}",
-                    params=params,
-                    headers=self.headers,
-                    timeout=config.YOUTUBE_REQUEST_TIMEOUT
-                )
+            logger.debug("YouTube API request to %s with params: %s", endpoint, {k: v for k, v in params.items() if k != 'key'})
+            for attempt in range(config.YOUTUBE_MAX_RETRIES + 1):
+                async with self._request_semaphore:
+                    response = await self._get_client().get(endpoint, params=params, headers=headers)
+                
+                if (response.status_code != 429 and response.status_code < 500) or attempt == config.YOUTUBE_MAX_RETRIES:
+                    break
+                
+                # Transient failure: back off (outside the semaphore, so other requests can proceed) and retry
+                delay = self._retry_delay(response, attempt)
+                logger.warning("YouTube API returned %s for %s; retrying in %.1fs", response.status_code, endpoint, delay)
+                await asyncio.sleep(delay)
+            
+            if response.status_code == 304 and stored:
+                logger.debug("YouTube API response not modified: %s", endpoint)
+                self._etag_store.set(store_key, stored)
+                return stored[1]
+            elif response.status_code == 200:
+                logger.debug("YouTube API request successful: %s (%s)", endpoint, response.http_version)
+                data = orjson.loads(response.content)
+                etag = response.headers.get('ETag')
+                if etag:
+                    self._etag_store.set(store_key, (etag, data))
+                return data
+            elif response.status_code == 403 and (reason := self._error_reason(response)) in self._QUOTA_ERROR_REASONS:
+                logger.warning("YouTube API quota exceeded for %s (%s); returning no results", endpoint, reason)
+                return None
+            else:
+                logger.warning("YouTube API request to %s failed: %s - %s", endpoint, response.status_code, response.text)
+                return None
                 
-                if response.status_code == 200:
-                    print(f"YouTube API request successful: {endpoint}")
-                    return response.json()
-                else:
-                    print(f"API request failed: {response.status_code} - {response.text}")
-                    return None
-                    
         except httpx.TimeoutException:
-            print(f"Timeout error for {endpoint} endpoint")
+            logger.warning("Timeout error for %s endpoint", endpoint)
             return None
         except httpx.RequestError as e:
-            print(f"Request error for {endpoint}: {str(e)}")
+            logger.warning("Request error for %s: %s", endpoint, e)
+            return None
+        except Exception:
+            logger.exception("Unexpected error for %s", endpoint)
             return None
-        except Exception as e:
-            print(f"Unexpected error for {endpoint}: {str(e)}")
+    
+    @classmethod
+    def _retry_delay(cls, response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait before retrying: the server's Retry-After if given, else jittered exponential backoff"""
+        retry_after = response.headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            delay = float(retry_after)
+        else:
+            delay = 2 ** attempt + random.random()
+        return min(delay, cls._MAX_RETRY_DELAY)
+    
+    @staticmethod
+    def _error_reason(response: httpx.Response) -> Optional[str]:
+        """Return the reason of the first error in a YouTube API error response, if any"""
+        try:
+            return orjson.loads(response.content)['error']['errors'][0]['reason']
+        except (orjson.JSONDecodeError, KeyError, IndexError, TypeError):
             return None
     
-    async def _batch_get_video_details(self, video_ids: List[str]) -> List[Dict[str, Any]]:
+    async def _batch_get_video_details(self, video_ids: List[str], known_categories: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
         """
         Batch fetch video details for multiple videos in a single API call
         
-        This is much more efficient than individual calls
+        This is much more efficient than individual calls, and videos in the
+        details cache aren't requested at all. known_categories maps video ids
+        to categories the caller already computed, which are reused instead of
+        categorizing those videos again. Categories are not cached, so a video's
+        category depends on this call only, not on which search cached it first
         """
         if not video_ids:
             return []
         
+        known_categories = known_categories or {}
+        
+        all_video_details = []
+        missing_ids = []
+        for video_id in video_ids:
+            cached = self._details_cache.get(video_id)
+            if cached is None:
+                missing_ids.append(video_id)
+            else:
+                video_details = dict(cached)
+                video_details['category'] = known_categories.get(video_id) or self._categorize_video(
+                    video_details['title'], video_details['description']
+                )
+                all_video_details.append(video_details)
+        
         try:
-            # YouTube API allows up to 50 video IDs in a single request
+            # YouTube API allows up to 50 video IDs in a single request. The chunks are
+            # fetched concurrently; the request semaphore still caps calls in flight
             batch_size = config.YOUTUBE_BATCH_SIZE
-            all_video_details = []
-            
-            for i in range(0, len(video_ids), batch_size):
-                batch_ids = video_ids[i:i + batch_size]
-                
-                params = {
+            responses = await asyncio.gather(*(
+                self._make_request('videos', {
                     'key': self.api_key,
                     'part': 'snippet,statistics,contentDetails',
-                    'id': ','.join(batch_ids)
-                }
-                
-                response_data = await self._make_request('videos', params)
-                
+                    'fields': self._VIDEO_FIELDS,
+                    'id': ','.join(missing_ids[i:i + batch_size])
+                })
+                for i in range(0, len(missing_ids), batch_size)
+            ))
+            
+            for response_data in responses:
                 if response_data and 'items' in response_data:
                     for video in response_data['items']:
-                        snippet = video['snippet']
-                        statistics = video.get('statistics', {})
-                        content_details = video.get('contentDetails', {})
-                        
-                        video_details = {
-                            'id': video['id'],
-                            'title': snippet['title'],
-                            'description': snippet['description'],
-                            'channel_title': snippet['channelTitle'],
-                            'published_at': snippet['publishedAt'],
-                            'thumbnail': snippet['thumbnails']['high']['url'],
-                            'url': f"https://www.youtube.com/watch?v={video['id']}",
-                            'view_count': int(statistics.get('viewCount', 0)),
-                            'like_count': int(statistics.get('likeCount', 0)),
-                            'comment_count': int(statistics.get('commentCount', 0)),
-                            'duration': content_details.get('duration', ''),
-                            'category': self._categorize_video(snippet['title'], snippet['description'])
-                        }
+                        try:
+                            video_details = self._build_video_dict(
+                                video['snippet'],
+                                video['id'],
+                                statistics=video.get('statistics', {}),
+                                content_details=video.get('contentDetails', {}),
+                                category=known_categories.get(video['id'])
+                            )
+                        except (KeyError, TypeError):
+                            # Skip malformed items instead of failing the whole batch
+                            continue
+                        self._details_cache.set(
+                            video_details['id'],
+                            {key: value for key, value in video_details.items() if key != 'category'}
+                        )
                         all_video_details.append(video_details)
             
             return all_video_details
             
-        except Exception as e:
-            print(f"Batch video details error: {str(e)}")
-            return []
+        except Exception:
+            logger.exception("Batch video details error")
+            # Keep whatever was cached or fetched before the error
+            return all_video_details
     
     async def search_movie_content(self, movie_title: str, max_results: int = 50) -> List[Dict[str, Any]]:
         """
@@ -125,17 +382,25 @@ class YouTubeService:
         
         Note: Reduced default max_results to prevent timeout issues
         """
+        # Limit max_results to prevent too many API calls. Clamped before building
+        # the cache key so requests that clamp to the same value share an entry
+        max_results = min(max_results, config.YOUTUBE_MAX_RESULTS)
+        
+        # YouTube search is case-insensitive, so differently-cased titles share an entry
+        cache_key = ('movie_content', movie_title.lower(), max_results)
+        cached = await self._get_cached_search(cache_key)
+        if cached is not None:
+            return [dict(video) for video in cached]
+        
         try:
             # Search for movie-related content
             search_query = f"{movie_title} movie"
             
-            # Limit max_results to prevent too many API calls
-            max_results = min(max_results, config.YOUTUBE_MAX_RESULTS)
-            
             params = {
                 'key': self.api_key,
                 'q': search_query,
                 'part': 'snippet',
+                'fields': self._SEARCH_FIELDS,
                 'maxResults': max_results,
                 'type': 'video',
                 'order': 'relevance',
@@ -151,53 +416,41 @@ class YouTubeService:
             video_ids = []
             
             for item in response_data.get('items', []):
-                video_id = item['id']['videoId']
-                video_data = {
-                    'id': video_id,
-                    'title': item['snippet']['title'],
-                    'description': item['snippet']['description'],
-                    'channel_title': item['snippet']['channelTitle'],
-                    'published_at': item['snippet']['publishedAt'],
-                    'thumbnail': item['snippet']['thumbnails']['high']['url'],
-                    'url': f"https://www.youtube.com/watch?v={video_id}",
-                    'category': self._categorize_video(item['snippet']['title'], item['snippet']['description'])
-                }
+                try:
+                    video_data = self._build_video_dict(item['snippet'], item['id']['videoId'])
+                except (KeyError, TypeError):
+                    # Skip malformed items instead of failing the whole search
+                    continue
                 videos.append(video_data)
-                video_ids.append(video_id)
+                video_ids.append(video_data['id'])
             
             # Try to batch fetch detailed information for all videos
+            details_complete = False
             try:
-                detailed_videos = await self._batch_get_video_details(video_ids)
+                detailed_videos = await self._batch_get_video_details(
+                    video_ids,
+                    known_categories={video['id']: video['category'] for video in videos}
+                )
                 
-                # Merge basic info with detailed info
+                # Merge basic info with detailed info, falling back to default stats
+                by_id = {detailed_video['id']: detailed_video for detailed_video in detailed_videos}
                 for video in videos:
-                    detailed_video = next((dv for dv in detailed_videos if dv['id'] == video['id']), None)
-                    if detailed_video:
-                        video.update(detailed_video)
-                    else:
-                        # Fallback: add default values for missing detailed info
-                        video.update({
-                            'view_count': 0,
-                            'like_count': 0,
-                            'comment_count': 0,
-                            'duration': ''
-                        })
+                    video.update(by_id.get(video['id'], _DEFAULT_STATS))
+                details_complete = len(by_id) == len(set(video_ids))
                         
             except Exception as e:
-                print(f"Batch fetch failed, using basic video data: {str(e)}")
+                logger.warning("Batch fetch failed, using basic video data: %s", e)
                 # Fallback: add default values for missing detailed info
                 for video in videos:
-                    video.update({
-                        'view_count': 0,
-                        'like_count': 0,
-                        'comment_count': 0,
-                        'duration': ''
-                    })
+                    video.update(_DEFAULT_STATS)
             
-            return videos
+            # Results padded with default stats aren't cached, so the next request fetches details again
+            if details_complete:
+                await self._set_cached_search(cache_key, videos)
+            return [dict(video) for video in videos]
             
-        except Exception as e:
-            print(f"An error occurred in search_movie_content: {e}")
+        except Exception:
+            logger.exception("Error in search_movie_content")
             return []
     
     async def search_actor_interviews(self, actor_name: str, movie_title: str = None, max_results: int = 8) -> List[Dict[str, Any]]:
@@ -207,6 +460,14 @@ class YouTubeService:
         Returns interview videos with the actor
         Note: Reduced default max_results to prevent timeout issues
         """
+        # Limit max_results to prevent too many API calls, before it goes into the cache key
+        max_results = min(max_results, 12)
+        
+        cache_key = ('actor_interviews', actor_name, movie_title, max_results)
+        cached = await self._get_cached_search(cache_key)
+        if cached is not None:
+            return [dict(video) for video in cached]
+        
         try:
             # Build search query
             if movie_title:
@@ -214,13 +475,11 @@ class YouTubeService:
             else:
                 search_query = f"{actor_name} interview"
             
-            # Limit max_results to prevent too many API calls
-            max_results = min(max_results, 12)
-            
             params = {
                 'key': self.api_key,
                 'q': search_query,
                 'part': 'snippet',
+                'fields': self._SEARCH_FIELDS,
                 'maxResults': max_results,
                 'type': 'video',
                 'order': 'relevance',
@@ -236,81 +495,95 @@ class YouTubeService:
             video_ids = []
             
             for item in response_data.get('items', []):
-                video_id = item['id']['videoId']
-                interview_data = {
-                    'id': video_id,
-                    'title': item['snippet']['title'],
-                    'description': item['snippet']['description'],
-                    'channel_title': item['snippet']['channelTitle'],
-                    'published_at': item['snippet']['publishedAt'],
-                    'thumbnail': item['snippet']['thumbnails']['high']['url'],
-                    'url': f"https://www.youtube.com/watch?v={video_id}",
-                    'actor': actor_name,
-                    'movie': movie_title,
-                    'category': 'interview'
-                }
+                try:
+                    interview_data = self._build_video_dict(item['snippet'], item['id']['videoId'], category='interview')
+                except (KeyError, TypeError):
+                    # Skip malformed items instead of failing the whole search
+                    continue
+                interview_data['actor'] = actor_name
+                interview_data['movie'] = movie_title
                 interviews.append(interview_data)
-                video_ids.append(video_id)
+                video_ids.append(interview_data['id'])
             
             # Batch fetch detailed information for all interviews
             detailed_interviews = await self._batch_get_video_details(video_ids)
             
             # Merge basic info with detailed info
+            by_id = {detailed_interview['id']: detailed_interview for detailed_interview in detailed_interviews}
             for interview in interviews:
-                detailed_interview = next((di for di in detailed_interviews if di['id'] == interview['id']), None)
-                if detailed_interview:
-                    interview.update(detailed_interview)
+                interview.update(by_id.get(interview['id'], _DEFAULT_STATS))
             
-            return interviews
+            # Results padded with default stats aren't cached, so the next request fetches details again
+            if len(by_id) == len(set(video_ids)):
+                await self._set_cached_search(cache_key, interviews)
+            return [dict(interview) for interview in interviews]
             
-        except Exception as e:
-            print(f"An error occurred: {e}")
+        except Exception:
+            logger.exception("Error in search_actor_interviews")
             return []
 
-    async def get_video_details(self, video_id: str) -> Optional[Dict[str, Any]]:
+    async def get_videos_details_bulk(self, video_ids: List[str], known_categories: Optional[Dict[str, str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get detailed information for many videos, keyed by video id
+        
+        Video ids are sent comma-separated, so N videos cost
+        ceil(N / YOUTUBE_BATCH_SIZE) API calls instead of N; ids already
+        in the details cache are not requested again. known_categories maps ids
+        to categories already computed by the caller (e.g. from search results)
+        """
+        detailed_videos = await self._batch_get_video_details(list(dict.fromkeys(video_ids)), known_categories)
+        return {video['id']: video for video in detailed_videos}
+    
+    async def get_video_details(self, video_id: str, known_category: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Get detailed information about a specific video
         
-        Returns video statistics and additional metadata
-        Note: This method is now deprecated in favor of batch fetching
+        Returns video statistics and additional metadata. Pass known_category
+        when the video was already categorized (e.g. from a search result)
+        Note: Prefer get_videos_details_bulk when fetching several videos
         """
-        try:
-            params = {
-                'key': self.api_key,
-                'part': 'snippet,statistics,contentDetails',
-                'id': video_id
-            }
-            
-            response_data = await self._make_request('videos', params)
-            
-            if not response_data or 'items' not in response_data:
-                return None
-            
-            video = response_data['items'][0]
-            snippet = video['snippet']
-            statistics = video.get('statistics', {})
-            content_details = video.get('contentDetails', {})
-            
-            video_details = {
-                'id': video_id,
-                'title': snippet['title'],
-                'description': snippet['description'],
-                'channel_title': snippet['channelTitle'],
-                'published_at': snippet['publishedAt'],
-                'thumbnail': snippet['thumbnails']['high']['url'],
-                'url': f"https://www.youtube.com/watch?v={video_id}",
-                'view_count': int(statistics.get('viewCount', 0)),
-                'like_count': int(statistics.get('likeCount', 0)),
-                'comment_count': int(statistics.get('commentCount', 0)),
-                'duration': content_details.get('duration', ''),
-                'category': self._categorize_video(snippet['title'], snippet['description'])
-            }
-            
-            return video_details
-            
-        except Exception as e:
-            print(f"An error occurred: {e}")
-            return None
+        known_categories = {video_id: known_category} if known_category else None
+        details = await self.get_videos_details_bulk([video_id], known_categories)
+        return details.get(video_id)
+    
+    def _build_video_dict(
+        self,
+        snippet: Dict[str, Any],
+        video_id: str,
+        statistics: Optional[Dict[str, Any]] = None,
+        content_details: Optional[Dict[str, Any]] = None,
+        category: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Build our standard video dict from an API snippet
+        
+        Statistics and duration are included when statistics are given (videos
+        endpoint). The category is computed from the title unless provided.
+        Raises KeyError/TypeError if a required snippet field is missing
+        """
+        title = snippet['title']
+        description = snippet['description']
+        video = {
+            'id': video_id,
+            'title': title,
+            'description': description,
+            'channel_title': snippet['channelTitle'],
+            'published_at': snippet['publishedAt'],
+            'thumbnail': self._thumbnail_url(snippet['thumbnails']),
+            'url': "https://www.youtube.com/watch?v=" + video_id
+        }
+        if statistics is not None:
+            video['view_count'] = int(statistics.get('viewCount', 0))
+            video['like_count'] = int(statistics.get('likeCount', 0))
+            video['comment_count'] = int(statistics.get('commentCount', 0))
+            video['duration'] = (content_details or {}).get('duration', '')
+        video['category'] = category or self._categorize_video(title, description)
+        return video
+    
+    @staticmethod
+    def _thumbnail_url(thumbnails: Dict[str, Any]) -> str:
+        """Return the best available thumbnail URL: high, then medium, then default"""
+        return (thumbnails.get('high') or thumbnails.get('medium') or thumbnails['default'])['url']
     
     def _categorize_video(self, title: str, description: str) -> str:
         """
@@ -318,24 +591,8 @@ class YouTubeService:
         
         Returns video category for better organization
         """
-        title_lower = title.lower()
-        desc_lower = description.lower()
-        
-        # Check for different video types
-        if any(word in title_lower for word in ['trailer', 'teaser']):
-            return 'trailer'
-        elif any(word in title_lower for word in ['interview', 'q&a', 'qa']):
-            return 'interview'
-        elif any(word in title_lower for word in ['behind the scenes', 'bts', 'making of']):
-            return 'behind_the_scenes'
-        elif any(word in title_lower for word in ['review', 'critic']):
-            return 'review'
-        elif any(word in title_lower for word in ['clip', 'scene', 'moment']):
-            return 'clip'
-        elif any(word in title_lower for word in ['music', 'song', 'soundtrack']):
-            return 'music'
-        else:
-            return 'other'
+        match = self._CATEGORY_PATTERN.match(title)
+        return match.lastgroup if match else 'other'
     
     def format_movie_data(self, movie_title: str, videos: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -343,30 +600,21 @@ class YouTubeService:
         
         Organizes videos by category and provides summary information
         """
-        # Group videos by category
-        categorized_videos = {}
+        # Group videos by category and total their views in a single pass
+        categorized_videos = defaultdict(list)
+        total_views = 0
         for video in videos:
-            category = video.get('category', 'other')
-            if category not in categorized_videos:
-                categorized_videos[category] = []
-            categorized_videos[category].append(video)
+            categorized_videos[video.get('category', 'other')].append(video)
+            total_views += video.get('view_count', 0)
         
-        # Create summary statistics
-        total_videos = len(videos)
-        total_views = sum(video.get('view_count', 0) for video in videos)
+        videos_by_category = dict(categorized_videos)
         
         formatted = {
             'title': movie_title,
-            'total_videos': total_videos,
+            'total_videos': len(videos),
             'total_views': total_views,
-            'videos_by_category': categorized_videos,
-            'trailers': categorized_videos.get('trailer', []),
-            'interviews': categorized_videos.get('interview', []),
-            'behind_the_scenes': categorized_videos.get('behind_the_scenes', []),
-            'reviews': categorized_videos.get('review', []),
-            'clips': categorized_videos.get('clip', []),
-            'music': categorized_videos.get('music', []),
-            'other': categorized_videos.get('other', []),
+            'videos_by_category': videos_by_category,
+            **{field: videos_by_category.get(category, []) for field, category in self._CATEGORY_FIELDS},
             'actors': [],  # Will be populated in Step 3
             'brand_products': []  # Will be populated in Step 4
         }
@@ -387,9 +635,8 @@ class YouTubeService:
             description = video.get('description', '').lower()
             
             # Look for movie titles in quotes or after "in" or "about"
-            import re
             # Pattern to find movie titles in quotes
-            quoted_movies = re.findall(r'"([^"]+)"', title + ' ' + description)
+            quoted_movies = _QUOTED_RE.findall(title + ' ' + description)
             for movie in quoted_movies:
                 if any(keyword in movie for keyword in movie_keywords):
                     continue
@@ -397,7 +644,7 @@ class YouTubeService:
                     movies.add(movie.title())
             
             # Look for patterns like "Actor Name in Movie Title"
-            in_pattern = re.findall(r'in\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', title)
+            in_pattern = _IN_TITLE_RE.findall(title)
             for movie in in_pattern:
                 if len(movie.split()) >= 2:
                     movies.add(movie)
@@ -419,10 +666,9 @@ class YouTubeService:
             # Look for actor names in interview titles
             if 'interview' in title.lower():
                 # Common patterns: "Actor Name Interview" or "Interview with Actor Name"
-                import re
                 
                 # Pattern 1: "Actor Name Interview"
-                actor_match = re.search(r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+Interview', title)
+                actor_match = _ACTOR_INTERVIEW_RE.search(title)
                 if actor_match:
                     actor_name = actor_match.group(1)
                     if actor_name not in actor_data:
@@ -445,7 +691,7 @@ class YouTubeService:
                         })
                 
                 # Pattern 2: "Interview with Actor Name"
-                with_match = re.search(r'Interview\s+with\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', title)
+                with_match = _INTERVIEW_WITH_RE.search(title)
                 if with_match:
                     actor_name = with_match.group(1)
                     if actor_name not in actor_data:
@@ -476,34 +722,25 @@ class YouTubeService:
         """
         Get recent content from the last N months
         """
-        from datetime import datetime, timedelta
-        cutoff_date = datetime.now() - timedelta(days=months * 30)
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=months * 30)
         
         recent_videos = []
         for video in videos:
             if video.get('published_at'):
-                try:
-                    published_date = datetime.fromisoformat(video['published_at'].replace('Z', '+00:00'))
-                    if published_date > cutoff_date:
-                        recent_videos.append(video)
-                except:
-                    continue
+                published_date = _parse_published_at(video['published_at'])
+                if published_date and published_date > cutoff_date:
+                    recent_videos.append((published_date, video))
         
-        # Sort by published date (newest first)
-        recent_videos.sort(key=lambda x: x.get('published_at', ''), reverse=True)
-        return recent_videos[:10]  # Return top 10 recent videos
+        # Return top 10 recent videos, newest first
+        return [video for _, video in heapq.nlargest(10, recent_videos, key=itemgetter(0))]
 
     def get_top_interviews(self, videos: List[Dict[str, Any]], top_n: int = 5) -> List[Dict[str, Any]]:
         """
         Get top interviews by view count
         """
-        # Filter only interviews
-        interviews = [v for v in videos if v.get('category') == 'interview']
-        
-        # Sort by view count (highest first)
-        interviews.sort(key=lambda x: x.get('view_count', 0), reverse=True)
-        
-        return interviews[:top_n]
+        # Select the top_n interviews by view count (highest first) without sorting them all
+        interviews = (v for v in videos if v.get('category') == 'interview')
+        return heapq.nlargest(top_n, interviews, key=lambda x: x.get('view_count', 0))
 
     # Step 3: Enhanced Actor Interview Aggregation Methods
     
@@ -525,27 +762,9 @@ class YouTubeService:
         }
         
         for interview in interviews:
-            title = interview.get('title', '').lower()
-            description = interview.get('description', '').lower()
-            channel = interview.get('channel_title', '').lower()
-            
-            # Categorize based on title, description, and channel
-            if any(word in title for word in ['junket', 'press', 'roundtable']):
-                categories['press_junket'] += 1
-            elif any(word in title for word in ['talk show', 'late night', 'tonight show', 'ellen']):
-                categories['talk_show'] += 1
-            elif any(word in title for word in ['podcast', 'episode']):
-                categories['podcast'] += 1
-            elif any(word in title for word in ['red carpet', 'premiere', 'awards']):
-                categories['red_carpet'] += 1
-            elif any(word in title for word in ['behind the scenes', 'bts', 'making of']):
-                categories['behind_scenes'] += 1
-            elif any(word in title for word in ['q&a', 'qa', 'question']):
-                categories['q_and_a'] += 1
-            elif any(word in title for word in ['documentary', 'biography']):
-                categories['documentary'] += 1
-            else:
-                categories['other'] += 1
+            # Categorize based on title: the first type with a matching keyword wins
+            match = self._INTERVIEW_TYPE_PATTERN.match(interview.get('title', ''))
+            categories[match.lastgroup if match else 'other'] += 1
         
         # Remove categories with 0 count
         return {k: v for k, v in categories.items() if v > 0}
@@ -557,6 +776,7 @@ class YouTubeService:
         Creates a chronological list of actor's work
         """
         timeline = []
+        movies_lower = [(movie, movie.lower()) for movie in movies]
         
         # Extract year information from interviews and movie mentions
         for interview in interviews:
@@ -564,24 +784,30 @@ class YouTubeService:
             description = interview.get('description', '')
             
             # Look for movie titles and years in interview content
-            import re
-            year_pattern = r'\b(19|20)\d{2}\b'
-            years = re.findall(year_pattern, title + ' ' + description)
+            years = _YEAR_RE.findall(title + ' ' + description)
+            if not years:
+                continue
+            
+            # Movie titles mentioned in the same content (the same for every year found)
+            title_lower = title.lower()
+            description_lower = description.lower()
+            mentioned_movies = [
+                movie for movie, movie_lower in movies_lower
+                if movie_lower in title_lower or movie_lower in description_lower
+            ]
             
             for year in years:
                 full_year = int(year)
                 if 1900 <= full_year <= 2030:  # Reasonable year range
-                    # Look for movie titles in the same content
-                    for movie in movies:
-                        if movie.lower() in title.lower() or movie.lower() in description.lower():
-                            timeline.append({
-                                'year': full_year,
-                                'movie_title': movie,
-                                'role': None,  # Will be enhanced in future steps
-                                'type': 'movie',
-                                'rating': None,
-                                'box_office': None
-                            })
+                    for movie in mentioned_movies:
+                        timeline.append({
+                            'year': full_year,
+                            'movie_title': movie,
+                            'role': None,  # Will be enhanced in future steps
+                            'type': 'movie',
+                            'rating': None,
+                            'box_office': None
+                        })
         
         # Sort by year and remove duplicates
         unique_timeline = []
@@ -607,10 +833,10 @@ class YouTubeService:
             description = interview.get('description', '')
             
             # Look for collaboration patterns
-            import re
+            with_re, interview_with_re = _collaboration_patterns(actor_name)
             
             # Pattern: "Actor Name with/and Collaborator Name"
-            with_pattern = re.findall(rf'{re.escape(actor_name)}\s+(?:with|and)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', title)
+            with_pattern = with_re.findall(title)
             for collaborator in with_pattern:
                 if collaborator not in collaborations:
                     collaborations[collaborator] = {
@@ -624,7 +850,7 @@ class YouTubeService:
                 collaborations[collaborator]['total_views'] += interview.get('view_count', 0)
             
             # Pattern: "Interview with Actor Name and Collaborator Name"
-            interview_with_pattern = re.findall(rf'Interview\s+with\s+{re.escape(actor_name)}\s+and\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', title)
+            interview_with_pattern = interview_with_re.findall(title)
             for collaborator in interview_with_pattern:
                 if collaborator not in collaborations:
                     collaborations[collaborator] = {
@@ -657,37 +883,34 @@ class YouTubeService:
             'tiktok': {'mentions': 0, 'accounts': []}
         }
         
+        # Instagram handles in first-seen order (a dict, so duplicate checks are O(1))
+        instagram_handles = {}
+        
         for interview in interviews:
             title = interview.get('title', '')
             description = interview.get('description', '')
             content = title + ' ' + description
+            content_lower = content.lower()
             
             # Look for social media patterns
-            import re
-            
-            # Instagram patterns
-            instagram_patterns = [
-                r'@([a-zA-Z0-9._]+)',  # @username
-                r'instagram\.com/([a-zA-Z0-9._]+)',  # instagram.com/username
-                r'#([a-zA-Z0-9_]+)'  # hashtags
-            ]
             
-            for pattern in instagram_patterns:
-                matches = re.findall(pattern, content)
-                for match in matches:
-                    if 'instagram' in content.lower():
-                        social_media['instagram']['mentions'] += 1
-                        if match not in social_media['instagram']['handles']:
-                            social_media['instagram']['handles'].append(match)
+            # Instagram patterns, only counted when the content mentions Instagram
+            if 'instagram' in content_lower:
+                for pattern in _INSTAGRAM_PATTERNS:
+                    matches = pattern.findall(content)
+                    social_media['instagram']['mentions'] += len(matches)
+                    instagram_handles.update(dict.fromkeys(matches))
             
             # Twitter patterns
-            if 'twitter' in content.lower() or 'tweet' in content.lower():
+            if 'twitter' in content_lower or 'tweet' in content_lower:
                 social_media['twitter']['mentions'] += 1
             
             # YouTube patterns
-            if 'youtube' in content.lower() or 'channel' in content.lower():
+            if 'youtube' in content_lower or 'channel' in content_lower:
                 social_media['youtube']['mentions'] += 1
         
+        social_media['instagram']['handles'] = list(instagram_handles)
+        
         # Remove empty platforms
         return {k: v for k, v in social_media.items() if v['mentions'] > 0}
 
@@ -698,144 +921,141 @@ class YouTubeService:
         Identifies genres based on movie mentions and descriptions
         """
         genres = set()
-        genre_keywords = {
-            'action': ['action', 'thriller', 'adventure', 'war', 'martial arts'],
-            'comedy': ['comedy', 'funny', 'humor', 'satire', 'rom-com'],
-            'drama': ['drama', 'emotional', 'serious', 'character study'],
-            'horror': ['horror', 'scary', 'frightening', 'supernatural'],
-            'sci_fi': ['science fiction', 'sci-fi', 'futuristic', 'space', 'alien'],
-            'romance': ['romance', 'love story', 'romantic', 'relationship'],
-            'fantasy': ['fantasy', 'magical', 'superhero', 'mythical'],
-            'documentary': ['documentary', 'biography', 'real story', 'true story'],
-            'animation': ['animation', 'animated', 'cartoon', 'pixar', 'disney']
-        }
         
         for item in content:
             title = item.get('title', '').lower()
             description = item.get('description', '').lower()
             content_text = title + ' ' + description
             
-            for genre, keywords in genre_keywords.items():
-                if any(keyword in content_text for keyword in keywords):
+            # Only look for genres that haven't been found yet
+            for genre, keywords in _GENRE_KEYWORDS.items():
+                if genre not in genres and any(keyword in content_text for keyword in keywords):
                     genres.add(genre)
+            
+            if len(genres) == len(_GENRE_KEYWORDS):
+                break
         
         return list(genres)
 
-    def extract_actors_from_movie_content_enhanced(self, videos: List[Dict[str, Any]], movie_title: str) -> List[Dict[str, Any]]:
+    def extract_actors_from_movie_content_enhanced(
+        self,
+        videos: List[Dict[str, Any]],
+        movie_title: str,
+        top_k: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Enhanced actor extraction with confidence scores and analysis
         
-        Returns actors with confidence scores and sample interviews
+        Returns actors with confidence scores and sample interviews, highest
+        confidence first; only the top_k actors if given
         """
         actor_data = {}
+        movie_title_lc = movie_title.lower()
         
         for video in videos:
             title = video.get('title', '')
-            description = video.get('description', '')
+            title_lc = title.lower()
             
-            # Look for actor names in interview titles with enhanced patterns
-            if 'interview' in title.lower():
-                import re
-                
-                # Enhanced actor name patterns
-                patterns = [
-                    r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+Interview',  # "Actor Name Interview"
-                    r'Interview\s+with\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',  # "Interview with Actor Name"
-                    r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+on\s+[A-Z]',  # "Actor Name on Show"
-                    r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+talks\s+about',  # "Actor Name talks about"
-                ]
-                
-                for pattern in patterns:
-                    actor_match = re.search(pattern, title)
-                    if actor_match:
-                        actor_name = actor_match.group(1)
-                        
-                        # Calculate confidence score based on various factors
-                        confidence_score = self._calculate_actor_confidence(actor_name, title, description, movie_title)
-                        
-                        if actor_name not in actor_data:
-                            actor_data[actor_name] = {
-                                'actor_name': actor_name,
-                                'confidence_score': confidence_score,
-                                'interview_count': 0,
-                                'total_views': 0,
-                                'recent_activity': 'low',
-                                'primary_genres': [],
-                                'sample_interviews': []
-                            }
-                        
-                        actor_data[actor_name]['interview_count'] += 1
-                        actor_data[actor_name]['total_views'] += video.get('view_count', 0)
-                        
-                        # Add sample interview if we don't have enough
-                        if len(actor_data[actor_name]['sample_interviews']) < 3:
-                            actor_data[actor_name]['sample_interviews'].append(video)
+            # Look for actor names in interview titles only
+            if 'interview' not in title_lc:
+                continue
+            
+            # Enhanced actor name patterns, matched in one pass
+            actor_match = _ACTOR_NAME_RE.search(title)
+            if not actor_match:
+                continue
+            actor_name = actor_match[actor_match.lastgroup]
+            
+            actor = actor_data.get(actor_name)
+            if actor is None:
+                # Confidence is scored from the actor's first interview only
+                confidence_score = self._calculate_actor_confidence(
+                    actor_name.lower(), title_lc, video.get('description', '').lower(), movie_title_lc
+                )
+                actor = actor_data[actor_name] = {
+                    'actor_name': actor_name,
+                    'confidence_score': confidence_score,
+                    'interview_count': 0,
+                    'total_views': 0,
+                    'recent_activity': 'low',
+                    'primary_genres': [],
+                    'sample_interviews': []
+                }
+            
+            actor['interview_count'] += 1
+            actor['total_views'] += video.get('view_count', 0)
+            
+            # Add sample interview if we don't have enough
+            sample_interviews = actor['sample_interviews']
+            if len(sample_interviews) < 3:
+                sample_interviews.append(video)
         
-        # Calculate recent activity and genres for each actor
-        for actor in actor_data.values():
-            actor['recent_activity'] = self._calculate_recent_activity(actor['sample_interviews'])
-            actor['primary_genres'] = self.extract_genres_from_content(actor['sample_interviews'])
+        # Order by confidence score, selecting only the top_k when the caller needs fewer
+        if top_k is None:
+            actors_list = sorted(actor_data.values(), key=lambda x: x['confidence_score'], reverse=True)
+        else:
+            actors_list = heapq.nlargest(top_k, actor_data.values(), key=lambda x: x['confidence_score'])
         
-        # Convert to list and sort by confidence score
-        actors_list = list(actor_data.values())
-        actors_list.sort(key=lambda x: x['confidence_score'], reverse=True)
+        # Calculate recent activity and genres for the returned actors, against one cutoff for the batch
+        activity_cutoff = datetime.now(timezone.utc) - timedelta(days=90)
+        for actor in actors_list:
+            actor['recent_activity'] = self._calculate_recent_activity(actor['sample_interviews'], activity_cutoff)
+            actor['primary_genres'] = self.extract_genres_from_content(actor['sample_interviews'])
         
         return actors_list
 
-    def _calculate_actor_confidence(self, actor_name: str, title: str, description: str, movie_title: str) -> float:
+    def _calculate_actor_confidence(self, actor_name_lc: str, title_lc: str, description_lc: str, movie_title_lc: str) -> float:
         """
         Calculate confidence score for actor identification
         
-        Returns score between 0.0 and 1.0
+        All arguments must already be lowercased, so callers can lowercase
+        each string once and reuse it. Returns score between 0.0 and 1.0
         """
         confidence = 0.0
         
         # Base confidence for having "interview" in title
-        if 'interview' in title.lower():
+        if 'interview' in title_lc:
             confidence += 0.3
         
         # Boost confidence if actor name appears multiple times
-        name_count = title.lower().count(actor_name.lower()) + description.lower().count(actor_name.lower())
+        name_count = title_lc.count(actor_name_lc) + description_lc.count(actor_name_lc)
         confidence += min(0.2, name_count * 0.1)
         
         # Boost confidence if movie title is mentioned
-        if movie_title.lower() in title.lower() or movie_title.lower() in description.lower():
+        if movie_title_lc in title_lc or movie_title_lc in description_lc:
             confidence += 0.2
         
         # Boost confidence for specific interview patterns
-        if any(pattern in title.lower() for pattern in ['talks about', 'discusses', 'reveals']):
+        if _INTERVIEW_VERB_RE.search(title_lc):
             confidence += 0.1
         
         # Boost confidence for professional interview sources
-        professional_sources = ['show', 'program', 'channel', 'network', 'tv']
-        if any(source in title.lower() for source in professional_sources):
+        if _PROFESSIONAL_SOURCE_RE.search(title_lc):
             confidence += 0.1
         
         # Cap confidence at 1.0
         return min(1.0, confidence)
 
-    def _calculate_recent_activity(self, interviews: List[Dict[str, Any]]) -> str:
+    def _calculate_recent_activity(self, interviews: List[Dict[str, Any]], cutoff_date: Optional[datetime] = None) -> str:
         """
         Calculate recent activity level based on interview dates
         
-        Returns 'high', 'medium', or 'low'
+        Interviews published after cutoff_date (default: 3 months ago) count
+        as recent. Returns 'high', 'medium', or 'low'
         """
         if not interviews:
             return 'low'
         
         # Count interviews from last 3 months
-        from datetime import datetime, timedelta
-        cutoff_date = datetime.now() - timedelta(days=90)
+        if cutoff_date is None:
+            cutoff_date = datetime.now(timezone.utc) - timedelta(days=90)
         
         recent_count = 0
         for interview in interviews:
             if interview.get('published_at'):
-                try:
-                    published_date = datetime.fromisoformat(interview['published_at'].replace('Z', '+00:00'))
-                    if published_date > cutoff_date:
-                        recent_count += 1
-                except:
-                    continue
+                published_date = _parse_published_at(interview['published_at'])
+                if published_date and published_date > cutoff_date:
+                    recent_count += 1
         
         if recent_count >= 3:
             return 'high'
@@ -853,7 +1073,7 @@ class YouTubeService:
         # This would typically integrate with additional APIs
         # For now, we'll use YouTube search as a fallback
         search_results = await self.search_movie_content(f"{query} actor interview", max_results)
-        return self.extract_actors_from_movie_content_enhanced(search_results, query)
+        return await asyncio.to_thread(self.extract_actors_from_movie_content_enhanced, search_results, query)
 
     def analyze_interview_patterns(self, interviews: List[Dict[str, Any]], actor_name: str) -> Dict[str, Any]:
         """
@@ -881,15 +1101,15 @@ class YouTubeService:
         # This would integrate with movie databases
         # For now, return basic timeline from interviews
         interviews = await self.search_actor_interviews(actor_name, None, max_results)
-        movies = self.extract_movies_from_content(interviews)
-        return self.build_career_timeline(actor_name, movies, interviews)
+        movies = await asyncio.to_thread(self.extract_movies_from_content, interviews)
+        return await asyncio.to_thread(self.build_career_timeline, actor_name, movies, interviews)
 
     async def get_actor_collaborations(self, actor_name: str, max_results: int) -> List[Dict[str, Any]]:
         """
         Get actor collaborations
         """
         interviews = await self.search_actor_interviews(actor_name, None, max_results)
-        return self.extract_collaborations(interviews, actor_name)
+        return await asyncio.to_thread(self.extract_collaborations, interviews, actor_name)
 
     async def get_trending_actors(self, period: str, max_results: int) -> List[Dict[str, Any]]:
         """
@@ -907,5 +1127,7 @@ class YouTubeService:
         # For now, return sample data
         return []
 
-# Global instance
-youtube_service = YouTubeService()
+@lru_cache(maxsize=1)
+def get_youtube_service() -> YouTubeService:
+    """Return the process-wide YouTubeService, created on first use"""
+    return YouTubeService()
@@ -3,7 +3,7 @@ echo Starting Movie Aggregator Service - Backend and Frontend
 echo.
 
 REM Start backend in a new window
-start "Backend Server" cmd /k "cd /d backend && python main.py"
+start "Backend Server" cmd /k "python -m backend.main"
 
 REM Wait a moment for backend to start
 timeout /t 3 /nobreak >nul
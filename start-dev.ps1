@@ -3,7 +3,7 @@ Write-Host ""
 
 # Start backend in background
 Write-Host "Starting Backend Server..." -ForegroundColor Yellow
-Start-Process powershell -ArgumentList "-NoExit", "-Command", "cd 'backend'; python main.py"
+Start-Process powershell -ArgumentList "-NoExit", "-Command", "python -m backend.main"
 
 # Wait a moment
 Start-Sleep -Seconds 3